@@ -1,3 +1,5 @@
+import io
+
 
 class CodeGen:
     '''
@@ -7,12 +9,18 @@ class CodeGen:
 
     _one_indent_level = '    '
 
+    class _Section:
+        __slots__ = ("buf", "indent", "indentStr")
+
+        def __init__(self):
+            self.buf = io.StringIO()
+            self.indent = 0
+            self.indentStr = ''
+
     def __init__(self):
-        self._sections = []
-        self._indents = []
+        self._sections = [CodeGen._Section()]
         self._sect = 0
-        self._sections.append([])
-        self._indents.append(0)
+        self._cur = self._sections[0]
 
     @property
     def section(self):
@@ -26,48 +34,58 @@ class CodeGen:
         to in any order
         '''
         while len(self._sections) <= section:
-            self._sections.append([])
-            self._indents.append(0)
+            self._sections.append(CodeGen._Section())
         self._sect = section
+        self._cur = self._sections[section]
 
 
     def indentBlock(self):
-        class Indenter(object):
-            def __init__(self, sf):
-                self.sf = sf
-            def __enter__(self):
-                self.sf.indent()
-            def __exit__(self, type, value, traceback):
-                self.sf.unindent()
-        return Indenter(self)
+        '''
+        context manager indenting the current section for the
+        duration of a with block
+        '''
+        return self
+
+    def __enter__(self):
+        self.indent()
+
+    def __exit__(self, type, value, traceback):
+        self.unindent()
 
     def indent(self):
         '''
         adds one level of indentation to the current section
         '''
-        self._indents[self._sect] += 1
+        section = self._cur
+        section.indent += 1
+        section.indentStr = CodeGen._one_indent_level * section.indent
 
     def unindent(self):
         '''
         removes one level of indentation to the current section
         '''
-        assert self._indents[self._sect] > 0, "negative indent"
-        self._indents[self._sect] -= 1
+        section = self._cur
+        assert section.indent > 0, "negative indent"
+        section.indent -= 1
+        section.indentStr = CodeGen._one_indent_level * section.indent
 
     def __call__(self, fmt="", *args):
         '''
         Append a line to the file at in its current section and
         indentation of the current section
         '''
-        indent = CodeGen._one_indent_level * self._indents[self._sect]
-        self._sections[self._sect].append(indent + (fmt % args))
+        section = self._cur
+        write = section.buf.write
+        line = (fmt % args if args else fmt).rstrip()
+        if line:
+            write(section.indentStr)
+            write(line)
+        write('\n')
 
 
     def writeOut(self, outFile, sect=-1):
         if sect < 0:
             for sect in self._sections:
-                for line in sect:
-                    print(line.rstrip(), file=outFile)
+                outFile.write(sect.buf.getvalue())
         else:
-            for line in self._sections[sect]:
-                print(line.rstrip(), file=outFile)
+            outFile.write(self._sections[sect].buf.getvalue())
@@ -9,22 +9,27 @@ def lower(s):
 
 
 def parseNumAfterLetter(string, letter):
-    num = ""
-    while len(string):
-        if string[0] == letter:
-            string = string[1:]
-            while len(string) and string[0].isdigit():
-                num += string[0]
-                string = string[1:]
-            break
-        string = string[1:]
-    if len(num): return int(num)
+    start = string.find(letter) + 1
+    if start == 0: return 0
+    end = start
+    while end < len(string) and string[end].isdigit():
+        end += 1
+    if end > start: return int(string[start:end])
     else: return 0
 
 def parseNumComponents(string):
     return sum(1 for _ in filter(isalpha, string))
 
 class Surface:
+    __slots__ = (
+        "name", "packed", "numFmts", "numComponents",
+        "redBits", "greenBits", "blueBits", "alphaBits",
+        "sharedExpBits", "depthBits", "stencilBits",
+        "totalBits", "colorBits",
+        "redShift", "greenShift", "blueShift", "alphaShift",
+        "baseName",
+    )
+
     def __init__(self, name, packed, numFmts):
         self.name = name
         self.packed = packed
@@ -44,13 +49,13 @@ class Surface:
         self.colorBits = self.redBits + self.greenBits + self.blueBits \
                         + self.alphaBits + self.sharedExpBits
 
-        letters = filter((lambda c: isalpha(c)), name)
+        letters = filter(isalpha, name)
 
         self.redShift = 0
         self.greenShift = 0
         self.blueShift = 0
         self.alphaShift = 0
-        comps = []
+        comps = set()
         for l in letters:
             bits = 0
             if l == "R":
@@ -70,7 +75,9 @@ class Surface:
                 self.blueShift += bits
             if "A" in comps:
                 self.alphaShift += bits
-            comps.append(l)
+            comps.add(l)
+
+        self.baseName = self.formatBaseName()
 
 
     def numFormatsStr(self):
@@ -85,11 +92,7 @@ class Surface:
         res = self.name.replace("_", "").lower()
 
         if contract:
-            resc = ""
-            for c in res:
-                if c.isdigit(): continue
-                resc += c
-            res = resc + str(self.redBits)
+            res = "".join(c for c in res if not c.isdigit()) + str(self.redBits)
 
         return res
 
@@ -98,9 +101,8 @@ class Surface:
 def parseSurfaces():
     from formatdata import formatData
     surfaces = []
-    for surf in formatData:
-        s = Surface(surf[0], surf[1], surf[2])
-        surfaces.append(s)
+    for name, packed, numFmts in formatData:
+        surfaces.append(Surface(name, packed, numFmts))
     return surfaces
 
 
@@ -124,7 +126,7 @@ def issueFormatEnum(surfaces, cg):
         num = 1
         for s in surfaces:
             for nf in s.numFmts:
-                cg("%s_%s = %s,", s.formatBaseName(), nf, num)
+                cg("%s_%s = %s,", s.baseName, nf, num)
                 num += 1
     cg("}")
 
@@ -193,7 +195,7 @@ def issueSurfStructs(surfaces, cg):
 
 
 def issueFormatStructs(surfaces, cg):
-    for fd in ((s.name, s.formatBaseName(), nf, s.packed) for s in surfaces for nf in s.numFmts):
+    for fd in ((s.name, s.baseName, nf, s.packed) for s in surfaces for nf in s.numFmts):
         surfName = fd[0]
         fbn = fd[1]
         nf = fd[2]